@@ -10,6 +10,7 @@
 
 from __future__ import absolute_import, division, print_function
 
+from functools import lru_cache
 from numbers import Integral
 
 import numpy as np
@@ -27,8 +28,14 @@ from odl.solvers.nonsmooth.proximal_operators import (
     proximal_convex_conj_linfty, proximal_huber, proximal_l1, proximal_l1_l2,
     proximal_l2, proximal_l2_squared, proximal_linfty)
 from odl.space import ProductSpace
+from odl.space.weighting import ArrayWeighting, ConstWeighting
 from odl.util import conj_exponent
 
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
 __all__ = ('ZeroFunctional', 'ConstantFunctional', 'ScalingFunctional',
            'IdentityFunctional',
            'LpNorm', 'L1Norm', 'GroupL1Norm', 'L2Norm', 'L2NormSquared',
@@ -43,6 +50,178 @@ __all__ = ('ZeroFunctional', 'ConstantFunctional', 'ScalingFunctional',
            'SeparableSum', 'MoreauEnvelope')
 
 
+def _integration_weights(space):
+    """Return the inner product weights of ``space``.
+
+    The returned value is the constant or array ``w`` for which
+    ``space.element(x).inner(space.one()) == sum(w * x)``, or ``None``
+    if the weighting scheme of ``space`` cannot be expressed that way
+    (e.g. custom inner products or mixed product space weightings).
+
+    Spaces with a non-numpy backend also give ``None``: the raw-array
+    fast paths built on this helper would force a transfer to host
+    memory, while the generic space operations stay on the backend.
+    """
+    if getattr(space, 'impl', 'numpy') != 'numpy':
+        return None
+
+    if isinstance(space, ProductSpace):
+        # The effective weight is the product of the outer (per-component)
+        # weight and the weights of the component spaces. Only the scalar
+        # case is worth handling here; anything else goes through the
+        # generic inner product.
+        outer = getattr(space, 'weighting', None)
+        if not space.is_power_space or not isinstance(outer, ConstWeighting):
+            return None
+        inner = _integration_weights(space[0])
+        if inner is None or not np.isscalar(inner):
+            return None
+        return float(outer.const) * inner
+
+    weighting = getattr(space, 'weighting', None)
+    if weighting is None:
+        return 1.0
+    elif isinstance(weighting, ConstWeighting):
+        return float(weighting.const)
+    elif isinstance(weighting, ArrayWeighting):
+        return np.ascontiguousarray(weighting.array)
+    else:
+        return None
+
+
+def _numpy_backed(space):
+    """Return True if elements of ``space`` stack into plain numpy arrays.
+
+    Used to decide whether raw-array fast paths may call ``asarray``
+    without leaving the space's backend or copying.
+    """
+    if isinstance(space, ProductSpace):
+        return space.is_power_space and _numpy_backed(space[0])
+    return getattr(space, 'impl', 'numpy') == 'numpy'
+
+
+# Minimum array size for routing a reduction through numexpr; below
+# this the kernel compilation and threading overhead dominates
+_NUMEXPR_MIN_SIZE = 2 ** 16
+
+# Tile size for blocked reductions, chosen to keep a tile plus its
+# scratch buffer resident in a typical L2 cache
+_TILE_BYTES = 262144
+# Arrays above this size are reduced tile by tile
+_TILED_REDUCE_THRESHOLD_BYTES = 2 ** 22
+
+
+def _tiled_abs_pow_sum(arr, exponent, weights):
+    """Return ``sum(weights * |arr| ** exponent)`` in L2-resident tiles.
+
+    Large volumes are streamed in blocks so that the elementwise work
+    runs on cache-resident data and the scratch memory stays bounded by
+    one tile instead of the full array size.
+    """
+    flat = arr.ravel()
+    wflat = None if np.isscalar(weights) else weights.ravel()
+    tile = max(1, _TILE_BYTES // flat.itemsize)
+    scratch = np.empty(min(tile, flat.size), dtype=flat.dtype)
+    total = 0.0
+    for start in range(0, flat.size, tile):
+        chunk = flat[start:start + tile]
+        buf = np.abs(chunk, out=scratch[:chunk.size])
+        if exponent != 1:
+            np.power(buf, exponent, out=buf)
+        if wflat is None:
+            total += np.sum(buf)
+        else:
+            total += np.dot(buf, wflat[start:start + tile])
+    if wflat is None and weights != 1.0:
+        total *= weights
+    return total
+
+
+def _any_negative(arr):
+    """Return ``True`` if any entry of ``arr`` is negative.
+
+    Large arrays are scanned tile by tile so that a violation near the
+    start returns after one tile instead of reducing the whole array,
+    which is the common case when infeasible points are tested.
+    """
+    flat = arr.ravel()
+    tile = max(1, _TILE_BYTES // flat.itemsize)
+    if flat.size <= tile:
+        return bool(flat.min() < 0) if flat.size else False
+    for start in range(0, flat.size, tile):
+        if flat[start:start + tile].min() < 0:
+            return True
+    return False
+
+
+def _fast_sign(arr):
+    """Return the elementwise sign of ``arr``.
+
+    For real input this uses two vectorized comparisons and a subtract,
+    which is branchless and faster than `numpy.sign`.
+    """
+    if np.iscomplexobj(arr):
+        return np.sign(arr)
+    return np.subtract(arr > 0, arr < 0, dtype=arr.dtype)
+
+
+def _dot_self(arr):
+    """Return ``sum(|arr| ** 2)`` in a single BLAS pass."""
+    arr = arr.ravel()
+    if np.iscomplexobj(arr):
+        return np.vdot(arr, arr).real
+    else:
+        return _f64_dot(arr, arr)
+
+
+def _f64_dot(a, b):
+    """Dot product of flat arrays with a float64 accumulator.
+
+    Low-precision input is accumulated in double precision, which costs
+    no extra memory traffic but avoids the error growth of a float32
+    accumulator over long reductions.
+    """
+    if a.dtype.char in 'ef' or b.dtype.char in 'ef':
+        return np.einsum('i,i->', a, b, dtype=np.float64)
+    return np.dot(a, b)
+
+
+def _weighted_sum(arr, weights):
+    """Return ``sum(weights * arr)`` in a single pass over ``arr``.
+
+    ``weights`` is a scalar or an array of the same total size as ``arr``
+    as returned by `_integration_weights`. float32 and float16 input is
+    accumulated in float64, see `_f64_dot`.
+    """
+    if np.isscalar(weights):
+        if arr.dtype.char in 'ef':
+            res = np.add.reduce(arr, axis=None, dtype=np.float64)
+        else:
+            res = np.sum(arr)
+        return res if weights == 1.0 else weights * res
+    else:
+        return _f64_dot(arr.ravel(), weights.ravel())
+
+
+def _memoized_scalar_proximal(factory):
+    """Wrap a proximal factory with a small cache over scalar stepsizes.
+
+    Iterative solvers typically request the proximal operator for the
+    same stepsize in every iteration; caching avoids rebuilding the
+    operator each time. Non-scalar stepsizes are passed through uncached.
+    """
+    cached_factory = lru_cache(maxsize=8)(factory)
+
+    def proximal_factory(sigma):
+        try:
+            sigma = float(sigma)
+        except (TypeError, ValueError):
+            return factory(sigma)
+        return cached_factory(sigma)
+
+    return proximal_factory
+
+
 class LpNorm(Functional):
 
     r"""The functional corresponding to the Lp-norm.
@@ -75,24 +254,168 @@ class LpNorm(Functional):
         super(LpNorm, self).__init__(
             space=space, linear=False, grad_lipschitz=np.nan)
         self.exponent = float(exponent)
+        self.__scratch = None
+        self.__weights = _integration_weights(space)
+        if np.isfinite(self.exponent) and self.exponent != 0:
+            self.__inv_exponent = 1.0 / self.exponent
+        else:
+            self.__inv_exponent = None
+
+        # Bind the exponent-specific implementation once; re-running the
+        # whole branch chain on every evaluation is pure dispatch overhead
+        if self.exponent == 0:
+            self.__call_impl = self._call_l0
+        elif self.exponent == 1:
+            self.__call_impl = self._call_l1
+        elif self.exponent == 2:
+            self.__call_impl = self._call_l2
+        elif np.isfinite(self.exponent):
+            self.__call_impl = self._call_lp
+        elif self.exponent == np.inf:
+            self.__call_impl = self._call_linf
+        elif self.exponent == -np.inf:
+            self.__call_impl = self._call_lneginf
+        else:
+            self.__call_impl = self._call_unknown
 
     # TODO: update when integration operator is in place: issue #440
     def _call(self, x):
         """Return the Lp-norm of ``x``."""
+        return self.__call_impl(x)
+
+    def _call_l0(self, x):
+        """Return the number of nonzero entries of ``x``."""
+        weights = self.__weights
+        if weights is None:
+            return self._domain_one.inner(np.not_equal(x, 0))
+        elif np.isscalar(weights):
+            # Dedicated SIMD popcount instead of a boolean inner product
+            count = np.count_nonzero(x.asarray())
+            return count if weights == 1.0 else weights * count
+        else:
+            return _weighted_sum(np.not_equal(x.asarray(), 0), weights)
+
+    def _call_l1(self, x):
+        """Return the L1-norm of ``x``."""
+        weights = self.__weights
+        if weights is None:
+            return x.ufuncs.absolute().inner(self._domain_one)
+        # `sum(w * |x|)` in one sweep, no one-element or fresh temporary
+        return _weighted_sum(self._abs_scratch(x), weights)
+
+    def _call_l2(self, x):
+        """Return the L2-norm of ``x``."""
+        weights = self.__weights
+        if np.isscalar(weights):
+            # `np.linalg.norm` hits the specialized euclidean kernel and
+            # handles scaling of extreme values better than sqrt-of-dot
+            norm = np.linalg.norm(x.asarray().ravel())
+            return norm if weights == 1.0 else np.sqrt(weights) * norm
+        return np.sqrt(x.inner(x))
+
+    def _call_lp(self, x):
+        """Return the Lp-norm of ``x`` for general finite ``p``."""
+        weights = self.__weights
+        if weights is None:
+            tmp = x.ufuncs.absolute()
+            tmp.ufuncs.power(self.exponent, out=tmp)
+            return np.power(tmp.inner(self._domain_one),
+                            self.__inv_exponent)
+        arr = x.asarray()
+        if (not np.iscomplexobj(arr) and
+                arr.nbytes > _TILED_REDUCE_THRESHOLD_BYTES):
+            # Large volume: reduce tile by tile to stay cache-resident
+            return np.power(
+                _tiled_abs_pow_sum(arr, self.exponent, weights),
+                self.__inv_exponent)
+        # Fused evaluation of `sum(|x| ** p) ** (1/p)` in the reusable
+        # scratch buffer; steady-state calls are allocation-free
+        tmp = self._abs_scratch(x)
+        np.power(tmp, self.exponent, out=tmp)
+        return np.power(_weighted_sum(tmp, weights), self.__inv_exponent)
+
+    def _abs_scratch(self, x):
+        """Return ``|x|`` computed into a reusable scratch array.
+
+        The scratch buffer is allocated on first use and reused by
+        subsequent evaluations, so steady-state calls are allocation-free.
+        Like the functional evaluation itself, this is not thread-safe.
+        """
+        arr = x.asarray()
+        if np.iscomplexobj(arr):
+            return np.abs(arr)
+        if self.__scratch is None or self.__scratch.shape != arr.shape:
+            self.__scratch = np.empty_like(arr)
+        return np.abs(arr, out=self.__scratch)
+
+    def _call_linf(self, x):
+        """Return the sup-norm of ``x``."""
+        return self._abs_scratch(x).max()
+
+    def _call_lneginf(self, x):
+        """Return the minimal absolute value of ``x``."""
+        return self._abs_scratch(x).min()
+
+    def _call_unknown(self, x):
+        """Raise an error for unsupported exponents."""
+        raise RuntimeError('unknown exponent')
+
+    def _call_batch(self, arrs):
+        """Return the norms of a batch of arrays in one vectorized call.
+
+        This replaces ``B`` separate evaluations with a single reduction
+        over the batch, which is significantly faster in solver loops
+        that score many candidate iterates (e.g. line searches).
+
+        Parameters
+        ----------
+        arrs : `array-like` with shape ``(B,) + self.domain.shape``
+            Batch of ``B`` raw arrays, each one an element of `domain`.
+
+        Returns
+        -------
+        norms : `numpy.ndarray` with shape ``(B,)``
+            The norm of each array in the batch.
+
+        Examples
+        --------
+        >>> space = odl.rn(3)
+        >>> func = LpNorm(space, exponent=2)
+        >>> func._call_batch([[3, 4, 0], [1, 0, 0]])
+        array([ 5.,  1.])
+        """
+        arrs = np.asarray(arrs)
+        flat = arrs.reshape(len(arrs), -1)
+        weights = self.__weights
+        if weights is None:
+            # Unknown weighting scheme, evaluate one by one
+            return np.array([self._call(self.domain.element(arr))
+                             for arr in arrs])
+
+        a = np.abs(flat)
         if self.exponent == 0:
-            return self.domain.one().inner(np.not_equal(x, 0))
+            if np.isscalar(weights):
+                return weights * np.count_nonzero(a, axis=1)
+            return np.dot(a != 0, weights.ravel())
         elif self.exponent == 1:
-            return x.ufuncs.absolute().inner(self.domain.one())
+            if np.isscalar(weights):
+                return weights * np.sum(a, axis=1)
+            return np.dot(a, weights.ravel())
         elif self.exponent == 2:
-            return np.sqrt(x.inner(x))
+            if np.isscalar(weights):
+                return np.sqrt(weights * np.einsum('ij,ij->i', a, a))
+            return np.sqrt(np.einsum('ij,j,ij->i', a, weights.ravel(), a))
         elif np.isfinite(self.exponent):
-            tmp = x.ufuncs.absolute()
-            tmp.ufuncs.power(self.exponent, out=tmp)
-            return np.power(tmp.inner(self.domain.one()), 1 / self.exponent)
+            np.power(a, self.exponent, out=a)
+            if np.isscalar(weights):
+                accum = weights * np.sum(a, axis=1)
+            else:
+                accum = np.dot(a, weights.ravel())
+            return np.power(accum, self.__inv_exponent)
         elif self.exponent == np.inf:
-            return x.ufuncs.absolute().ufuncs.max()
+            return np.max(a, axis=1)
         elif self.exponent == -np.inf:
-            return x.ufuncs.absolute().ufuncs.min()
+            return np.min(a, axis=1)
         else:
             raise RuntimeError('unknown exponent')
 
@@ -144,7 +467,7 @@ class LpNorm(Functional):
 
                 def _call(self, x):
                     """Apply the gradient operator to the given point."""
-                    return x.ufuncs.sign()
+                    return _fast_sign(x.asarray())
 
                 def derivative(self, x):
                     """Derivative is a.e. zero."""
@@ -171,7 +494,9 @@ class LpNorm(Functional):
                     if norm_of_x == 0:
                         return self.domain.zero()
                     else:
-                        return x / norm_of_x
+                        # Scale by the reciprocal: one scalar division
+                        # instead of one per element
+                        return x * (1.0 / norm_of_x)
 
             return L2Gradient()
 
@@ -251,12 +576,44 @@ class GroupL1Norm(Functional):
         super(GroupL1Norm, self).__init__(
             space=vfspace, linear=False, grad_lipschitz=np.nan)
         self.pointwise_norm = PointwiseNorm(vfspace, exponent)
+        self.__pwnorm_one = None
+        self.__weights = _integration_weights(self.pointwise_norm.range)
 
     def _call(self, x):
         """Return the group L1-norm of ``x``."""
         # TODO: update when integration operator is in place: issue #440
-        pointwise_norm = self.pointwise_norm(x)
-        return pointwise_norm.inner(pointwise_norm.space.one())
+        pwnorm = self.pointwise_norm
+        weights = self.__weights
+        if weights is None:
+            if self.__pwnorm_one is None:
+                self.__pwnorm_one = pwnorm.range.one()
+            return pwnorm(x).inner(self.__pwnorm_one)
+
+        # Accumulate the pointwise norm directly on the raw component
+        # arrays and fold the reduction into the same sweep, skipping the
+        # operator dispatch and the one-element of the plain inner product
+        pw_weights = pwnorm.weights if pwnorm.is_weighted else None
+        exponent = pwnorm.exponent
+        accum = None
+        for i, xi in enumerate(x):
+            arr = np.abs(xi.asarray())
+            if exponent == 2:
+                arr *= arr
+            elif exponent != 1 and exponent != np.inf:
+                np.power(arr, exponent, out=arr)
+            if pw_weights is not None:
+                arr *= pw_weights[i]
+            if accum is None:
+                accum = arr
+            elif exponent == np.inf:
+                np.maximum(accum, arr, out=accum)
+            else:
+                accum += arr
+        if exponent == 2:
+            np.sqrt(accum, out=accum)
+        elif exponent != 1 and exponent != np.inf:
+            np.power(accum, 1 / exponent, out=accum)
+        return _weighted_sum(accum, weights)
 
     @property
     def gradient(self):
@@ -296,10 +653,39 @@ class GroupL1Norm(Functional):
 
             def _call(self, x, out):
                 """Return ``self(x)``."""
-                pwnorm_x = functional.pointwise_norm(x)
-                pwnorm_x.ufuncs.sign(out=pwnorm_x)
-                functional.pointwise_norm.derivative(x).adjoint(pwnorm_x,
-                                                                out=out)
+                pwnorm = functional.pointwise_norm
+                exponent = pwnorm.exponent
+                if exponent not in (1, 2):
+                    pwnorm_x = pwnorm(x)
+                    pwnorm_x.ufuncs.sign(out=pwnorm_x)
+                    pwnorm.derivative(x).adjoint(pwnorm_x, out=out)
+                    return out
+
+                # Fused evaluation on the raw component arrays, replacing
+                # the pointwise-norm, sign and derivative-adjoint passes
+                # The pointwise weights enter the norm, but cancel in the
+                # output components since the derivative adjoint is taken
+                # with respect to the weighted inner product
+                weights = pwnorm.weights if pwnorm.is_weighted else None
+                arrs = [xi.asarray() for xi in x]
+                if exponent == 1:
+                    for arr, out_j in zip(arrs, out):
+                        out_j[:] = _fast_sign(arr)
+                else:
+                    sq = np.square(arrs[0])
+                    if weights is not None:
+                        sq *= weights[0]
+                    for j, arr in enumerate(arrs[1:], start=1):
+                        tmp = np.square(arr)
+                        if weights is not None:
+                            tmp *= weights[j]
+                        sq += tmp
+                    np.sqrt(sq, out=sq)
+                    # Reciprocal where the norm is nonzero; the gradient
+                    # is defined as 0 in the points where the norm vanishes
+                    inv = np.divide(1.0, sq, out=sq, where=(sq != 0))
+                    for arr, out_j in zip(arrs, out):
+                        out_j[:] = arr * inv
 
                 return out
 
@@ -384,7 +770,8 @@ class IndicatorGroupL1UnitBall(Functional):
 
     def _call(self, x):
         """Return ``self(x)``."""
-        x_norm = self.pointwise_norm(x).ufuncs.max()
+        # Reduce on the raw array rather than through the ufunc wrappers
+        x_norm = np.max(self.pointwise_norm(x).asarray())
 
         if x_norm > 1:
             return np.inf
@@ -472,6 +859,7 @@ class IndicatorLpUnitBall(Functional):
         super(IndicatorLpUnitBall, self).__init__(space=space, linear=False)
         self.__norm = LpNorm(space, exponent)
         self.__exponent = float(exponent)
+        self.__weights = _integration_weights(space)
 
     @property
     def exponent(self):
@@ -480,6 +868,25 @@ class IndicatorLpUnitBall(Functional):
 
     def _call(self, x):
         """Apply the functional to the given point."""
+        if self.exponent == 2:
+            # Compare the squared norm against 1, skipping the square root
+            weights = self.__weights
+            if np.isscalar(weights):
+                sq_norm = weights * _dot_self(x.asarray())
+            else:
+                sq_norm = x.inner(x)
+            return np.inf if sq_norm > 1 else 0
+        elif self.exponent == np.inf:
+            # Scan in blocks; the first entry with |x_i| > 1 already
+            # decides the answer, which in proximal methods usually
+            # saves most of the pass
+            arr = x.asarray().ravel()
+            blocksize = 2 ** 16
+            for start in range(0, arr.size, blocksize):
+                if np.max(np.abs(arr[start:start + blocksize])) > 1:
+                    return np.inf
+            return 0
+
         x_norm = self.__norm(x)
 
         if x_norm > 1:
@@ -665,12 +1072,56 @@ class L2NormSquared(Functional):
         """
         super(L2NormSquared, self).__init__(
             space=space, linear=False, grad_lipschitz=2)
+        # Decide once whether the raw-buffer dot applies; `None` means
+        # the generic inner product must be used
+        weights = _integration_weights(space)
+        self.__const_weight = weights if np.isscalar(weights) else None
 
     # TODO: update when integration operator is in place: issue #440
     def _call(self, x):
         """Return the squared L2-norm of ``x``."""
+        weight = self.__const_weight
+        if weight is not None:
+            # Single BLAS dot on the raw buffer, bypassing the wrapped
+            # inner product
+            return weight * _dot_self(x.asarray())
         return x.inner(x)
 
+    def _call_batch(self, arrs):
+        """Return the squared L2-norm of each array in a batch.
+
+        Parameters
+        ----------
+        arrs : `array-like` with shape ``(B,) + self.domain.shape``
+            Batch of ``B`` raw arrays, each one an element of `domain`.
+
+        Returns
+        -------
+        norms : `numpy.ndarray` with shape ``(B,)``
+            The squared norm of each array in the batch.
+
+        Examples
+        --------
+        >>> space = odl.rn(3)
+        >>> func = L2NormSquared(space)
+        >>> func._call_batch([[3, 4, 0], [1, 0, 0]])
+        array([ 25.,   1.])
+        """
+        arrs = np.asarray(arrs)
+        flat = arrs.reshape(len(arrs), -1)
+        if not np.issubdtype(flat.dtype, np.inexact):
+            flat = flat.astype(np.float64)
+        weight = self.__const_weight
+        if weight is None:
+            # Unknown weighting scheme, evaluate one by one
+            return np.array([self._call(self.domain.element(arr))
+                             for arr in arrs])
+        if np.iscomplexobj(flat):
+            res = np.einsum('ij,ij->i', flat.conj(), flat).real
+        else:
+            res = np.einsum('ij,ij->i', flat, flat)
+        return res if weight == 1.0 else weight * res
+
     @property
     def gradient(self):
         """Gradient operator of the functional."""
@@ -731,7 +1182,9 @@ class ConstantFunctional(Functional):
 
     def _call(self, x):
         """Return a constant value."""
-        return self.constant
+        # Read the attribute directly instead of through the property
+        # descriptor; this is on the hot path of composite functionals
+        return self.__constant
 
     @property
     def gradient(self):
@@ -883,10 +1336,15 @@ class IndicatorBox(Functional):
 
     def _call(self, x):
         """Apply the functional to the given point."""
-        # Since the proximal projects onto our feasible set we can simply
-        # check if it changes anything
-        proj = self.proximal(1)(x)
-        return np.inf if x.dist(proj) > 0 else 0
+        # Elementwise feasibility check in a single pass, avoiding the
+        # projection and distance computation of the former proximal
+        # round-trip
+        arr = x.asarray()
+        if self.lower is not None and np.any(arr < np.asarray(self.lower)):
+            return np.inf
+        if self.upper is not None and np.any(arr > np.asarray(self.upper)):
+            return np.inf
+        return 0
 
     @property
     def proximal(self):
@@ -1108,6 +1566,47 @@ class KullbackLeibler(Functional):
                              ''.format(prior, self.domain))
 
         self.__prior = prior
+        self.__proximal = None
+        self.__scratch = None
+        self._numpy_backed = _numpy_backed(space)
+        if prior is not None and self._numpy_backed:
+            # Contiguous array view of the prior, shared by the array paths
+            self._prior_arr = np.ascontiguousarray(prior.asarray())
+        else:
+            self._prior_arr = None
+        self.__weights = _integration_weights(space)
+        if prior is not None and self.__weights is not None:
+            # The integrand is x - g + g*log(g) - g*log(x) with the
+            # convention 0 log(0) := 0, so the mask of positive prior
+            # entries and the constant part g*log(g) - g can be computed
+            # once here; only log(x) remains per evaluation.
+            g = self._prior_arr
+            self.__prior_mask = (g > 0)
+            if np.count_nonzero(self.__prior_mask) <= g.size // 2:
+                # Sparse prior: gather the positive entries once so that
+                # the per-call log runs on those entries only
+                idx = np.flatnonzero(self.__prior_mask.ravel())
+                gpos = g.ravel()[idx]
+                w = self.__weights
+                wpos = w if np.isscalar(w) else w.ravel()[idx]
+                wg = wpos * gpos
+                self.__sparse_idx = idx
+                self.__sparse_wg = wg
+                self.__sparse_const = np.sum(wg * np.log(gpos) - wg)
+                self.__glogg_minus_g = None
+            else:
+                # Computed with the same masked log and multiply as in
+                # `_call` so that the terms cancel exactly at x == prior
+                logg = np.zeros_like(g)
+                np.log(g, out=logg, where=self.__prior_mask)
+                logg *= g
+                logg -= g
+                self.__glogg_minus_g = logg
+                self.__sparse_idx = None
+        else:
+            self.__prior_mask = None
+            self.__glogg_minus_g = None
+            self.__sparse_idx = None
 
     @property
     def prior(self):
@@ -1124,12 +1623,71 @@ class KullbackLeibler(Functional):
         # Lazy import to improve `import odl` time
         import scipy.special
 
-        with np.errstate(invalid='ignore', divide='ignore'):
-            if self.prior is None:
-                res = (x - 1 - np.log(x)).inner(self.domain.one())
-            else:
-                xlogy = scipy.special.xlogy(self.prior, self.prior / x)
-                res = (x - self.prior + xlogy).inner(self.domain.one())
+        weights = self.__weights
+        if weights is None:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                if self.prior is None:
+                    res = (x - 1 - np.log(x)).inner(self._domain_one)
+                else:
+                    xlogy = scipy.special.xlogy(self.prior, self.prior / x)
+                    res = (x - self.prior + xlogy).inner(self._domain_one)
+        else:
+            # Fused evaluation on the raw arrays: the expression is
+            # accumulated in a reused scratch buffer and reduced directly,
+            # without materializing the one-element
+            arr = x.asarray()
+            if (numexpr is not None and np.isscalar(weights)
+                    and arr.size >= _NUMEXPR_MIN_SIZE
+                    and (self.prior is None
+                         or self.__glogg_minus_g is not None)):
+                # Single fused multithreaded reduction, no temporaries
+                if self.prior is None:
+                    res = numexpr.evaluate(
+                        'sum(x - 1 - log(x))',
+                        local_dict={'x': arr.ravel()})
+                else:
+                    res = numexpr.evaluate(
+                        'sum(x + c - where(g > 0, g * log(x), 0.0))',
+                        local_dict={'x': arr.ravel(),
+                                    'g': self._prior_arr.ravel(),
+                                    'c': self.__glogg_minus_g.ravel()})
+                res = weights * float(res)
+                if not np.isfinite(res):
+                    return np.inf
+                return res
+            with np.errstate(invalid='ignore', divide='ignore'):
+                if self.prior is not None and self.__sparse_idx is not None:
+                    # Gathered evaluation: the log only runs on the
+                    # positive prior entries (0 log(0) := 0)
+                    xpos = arr.ravel()[self.__sparse_idx]
+                    if not (xpos > 0).all():
+                        return np.inf
+                    np.log(xpos, out=xpos)
+                    res = (_weighted_sum(arr, weights) + self.__sparse_const
+                           - _f64_dot(self.__sparse_wg, xpos))
+                else:
+                    tmp = self.__scratch
+                    if (tmp is None or tmp.shape != arr.shape
+                            or tmp.dtype != arr.dtype):
+                        # Zero-initialized so that masked-out entries
+                        # (prior == 0) never contribute to the log term
+                        tmp = self.__scratch = np.zeros_like(arr)
+                    if self.prior is None:
+                        if not (arr > 0).all():
+                            return np.inf
+                        np.log(arr, out=tmp)
+                        np.subtract(arr, tmp, out=tmp)
+                        tmp -= 1
+                    else:
+                        # Only the log term depends on x; the log is
+                        # evaluated at positive prior entries only
+                        if np.any((arr <= 0) & self.__prior_mask):
+                            return np.inf
+                        np.log(arr, out=tmp, where=self.__prior_mask)
+                        tmp *= self._prior_arr
+                        np.subtract(self.__glogg_minus_g, tmp, out=tmp)
+                        tmp += arr
+                    res = _weighted_sum(tmp, weights)
 
         if not np.isfinite(res):
             # In this case, some element was less than or equal to zero
@@ -1137,6 +1695,57 @@ class KullbackLeibler(Functional):
         else:
             return res
 
+    def _call_batch(self, arrs):
+        """Return the KL-divergence of each array in a batch.
+
+        Parameters
+        ----------
+        arrs : `array-like` with shape ``(B,) + self.domain.shape``
+            Batch of ``B`` raw arrays, each one an element of `domain`.
+
+        Returns
+        -------
+        values : `numpy.ndarray` with shape ``(B,)``
+            The divergence of each array; infeasible arrays give ``inf``.
+        """
+        arrs = np.asarray(arrs)
+        weights = self.__weights
+        if weights is None:
+            # Unknown weighting scheme, evaluate one by one
+            return np.array([self._call(self.domain.element(arr))
+                             for arr in arrs])
+
+        flat = arrs.reshape(len(arrs), -1)
+        if not np.issubdtype(flat.dtype, np.inexact):
+            flat = flat.astype(np.float64)
+        w = None if np.isscalar(weights) else weights.ravel()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if self.prior is None:
+                tmp = np.log(flat)
+                np.subtract(flat, tmp, out=tmp)
+                tmp -= 1
+                res = (weights * np.sum(tmp, axis=1) if w is None
+                       else np.dot(tmp, w))
+            elif self.__sparse_idx is not None:
+                xpos = flat[:, self.__sparse_idx]
+                np.log(xpos, out=xpos)
+                base = (weights * np.sum(flat, axis=1) if w is None
+                        else np.dot(flat, w))
+                res = (base + self.__sparse_const
+                       - np.dot(xpos, self.__sparse_wg))
+            else:
+                mask = self.__prior_mask.ravel()
+                tmp = np.zeros_like(flat)
+                np.log(flat, out=tmp, where=mask[None, :])
+                tmp *= self._prior_arr.ravel()
+                np.subtract(self.__glogg_minus_g.ravel(), tmp, out=tmp)
+                tmp += flat
+                res = (weights * np.sum(tmp, axis=1) if w is None
+                       else np.dot(tmp, w))
+        res = np.asarray(res, dtype=float)
+        res[~np.isfinite(res)] = np.inf
+        return res
+
     @property
     def gradient(self):
         r"""Gradient of the KL functional.
@@ -1161,16 +1770,26 @@ class KullbackLeibler(Functional):
                 super(KLGradient, self).__init__(
                     functional.domain, functional.domain, linear=False)
 
-            def _call(self, x):
-                """Apply the gradient operator to the given point.
+            def _call(self, x, out):
+                """Apply the gradient operator to ``x`` and store in ``out``.
 
                 The gradient is not defined in points where one or more
                 components are non-positive.
                 """
-                if functional.prior is None:
-                    return (-1.0) / x + 1
-                else:
-                    return (-functional.prior) / x + 1
+                if not functional._numpy_backed:
+                    # Keep backend-native element arithmetic
+                    if functional.prior is None:
+                        out.assign((-1.0) / x + 1)
+                    else:
+                        out.assign((-functional.prior) / x + 1)
+                    return
+                g = functional._prior_arr
+                out_arr = out.asarray()
+                np.divide(1.0 if g is None else g, x.asarray(), out=out_arr)
+                np.subtract(1, out_arr, out=out_arr)
+                if isinstance(out.space, ProductSpace):
+                    # `asarray` of a product space element is a copy
+                    out[:] = out_arr
 
         return KLGradient()
 
@@ -1185,8 +1804,11 @@ class KullbackLeibler(Functional):
         odl.solvers.nonsmooth.proximal_operators.proximal_convex_conj :
             Proximal of the convex conjugate of a functional.
         """
-        return proximal_convex_conj(proximal_convex_conj_kl(space=self.domain,
-                                                            g=self.prior))
+        if self.__proximal is None:
+            self.__proximal = _memoized_scalar_proximal(
+                proximal_convex_conj(proximal_convex_conj_kl(
+                    space=self.domain, g=self.prior)))
+        return self.__proximal
 
     @property
     def convex_conj(self):
@@ -1242,6 +1864,19 @@ class KullbackLeiblerConvexConj(Functional):
                              ''.format(prior, self.domain))
 
         self.__prior = prior
+        self.__proximal = None
+        self._numpy_backed = _numpy_backed(space)
+        if prior is not None and self._numpy_backed:
+            # Contiguous array view of the prior, shared by the array paths
+            self._prior_arr = np.ascontiguousarray(prior.asarray())
+        else:
+            self._prior_arr = None
+        self.__weights = _integration_weights(space)
+        if self._prior_arr is not None and self.__weights is not None:
+            # The value is finite iff x < 1 wherever the prior is positive
+            self.__prior_mask = (self._prior_arr > 0)
+        else:
+            self.__prior_mask = None
 
     @property
     def prior(self):
@@ -1258,12 +1893,34 @@ class KullbackLeiblerConvexConj(Functional):
         # Lazy import to improve `import odl` time
         import scipy.special
 
-        with np.errstate(invalid='ignore'):
-            if self.prior is None:
-                res = -(np.log(1 - x)).inner(self.domain.one())
-            else:
-                xlogy = scipy.special.xlogy(self.prior, 1 - x)
-                res = -self.domain.element(xlogy).inner(self.domain.one())
+        weights = self.__weights
+        if weights is None:
+            with np.errstate(invalid='ignore'):
+                if self.prior is None:
+                    res = -(np.log(1 - x)).inner(self._domain_one)
+                else:
+                    xlogy = scipy.special.xlogy(self.prior, 1 - x)
+                    res = -self.domain.element(xlogy).inner(
+                        self._domain_one)
+        else:
+            # Reduce the integrand directly with the integration weights
+            # instead of taking the inner product with a one-element
+            arr = x.asarray()
+            with np.errstate(invalid='ignore'):
+                # Deterministic feasibility check up front instead of
+                # relying on NaN propagation through the log
+                if self.prior is None:
+                    if (arr >= 1).any():
+                        return np.inf
+                elif np.any((arr >= 1) & self.__prior_mask):
+                    return np.inf
+                tmp = np.negative(arr)
+                if self.prior is None:
+                    # log1p(-x) is more accurate than log(1 - x) near 0
+                    np.log1p(tmp, out=tmp)
+                else:
+                    scipy.special.xlog1py(self._prior_arr, tmp, out=tmp)
+                res = -_weighted_sum(tmp, weights)
 
         if not np.isfinite(res):
             # In this case, some element was larger than or equal to one
@@ -1289,16 +1946,26 @@ class KullbackLeiblerConvexConj(Functional):
                 super(KLCCGradient, self).__init__(
                     functional.domain, functional.domain, linear=False)
 
-            def _call(self, x):
-                """Apply the gradient operator to the given point.
+            def _call(self, x, out):
+                """Apply the gradient operator to ``x`` and store in ``out``.
 
                 The gradient is not defined in points where one or more
                 components are larger than or equal to one.
                 """
-                if functional.prior is None:
-                    return 1.0 / (1 - x)
-                else:
-                    return functional.prior / (1 - x)
+                if not functional._numpy_backed:
+                    # Keep backend-native element arithmetic
+                    if functional.prior is None:
+                        out.assign(1.0 / (1 - x))
+                    else:
+                        out.assign(functional.prior / (1 - x))
+                    return
+                g = functional._prior_arr
+                out_arr = out.asarray()
+                np.subtract(1, x.asarray(), out=out_arr)
+                np.divide(1.0 if g is None else g, out_arr, out=out_arr)
+                if isinstance(out.space, ProductSpace):
+                    # `asarray` of a product space element is a copy
+                    out[:] = out_arr
 
         return KLCCGradient()
 
@@ -1313,7 +1980,10 @@ class KullbackLeiblerConvexConj(Functional):
         odl.solvers.nonsmooth.proximal_operators.proximal_convex_conj :
             Proximal of the convex conjugate of a functional.
         """
-        return proximal_convex_conj_kl(space=self.domain, g=self.prior)
+        if self.__proximal is None:
+            self.__proximal = _memoized_scalar_proximal(
+                proximal_convex_conj_kl(space=self.domain, g=self.prior))
+        return self.__proximal
 
     @property
     def convex_conj(self):
@@ -1389,6 +2059,21 @@ class KullbackLeiblerCrossEntropy(Functional):
                              ''.format(prior, self.domain))
 
         self.__prior = prior
+        self.__proximal = None
+        self._numpy_backed = _numpy_backed(space)
+        if prior is not None and self._numpy_backed:
+            # Contiguous array view of the prior, shared by the array paths
+            self._prior_arr = np.ascontiguousarray(prior.asarray())
+        else:
+            self._prior_arr = None
+        self.__weights = _integration_weights(space)
+        if (prior is not None and self.__weights is not None
+                and np.all(self._prior_arr > 0)):
+            # log(g) is a constant of the functional; with it the per-call
+            # division x / g disappears from the integrand
+            self.__log_prior = np.log(self._prior_arr)
+        else:
+            self.__log_prior = None
 
     @property
     def prior(self):
@@ -1405,13 +2090,41 @@ class KullbackLeiblerCrossEntropy(Functional):
         # Lazy import to improve `import odl` time
         import scipy.special
 
-        with np.errstate(invalid='ignore', divide='ignore'):
-            if self.prior is None:
-                xlogx = scipy.special.xlogy(x, x)
-                res = (1 - x + xlogx).inner(self.domain.one())
-            else:
-                xlogy = scipy.special.xlogy(x, x / self.prior)
-                res = (self.prior - x + xlogy).inner(self.domain.one())
+        weights = self.__weights
+        if weights is None:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                if self.prior is None:
+                    xlogx = scipy.special.xlogy(x, x)
+                    res = (1 - x + xlogx).inner(self._domain_one)
+                else:
+                    xlogy = scipy.special.xlogy(x, x / self.prior)
+                    res = (self.prior - x + xlogy).inner(self._domain_one)
+        else:
+            # Reduce the integrand directly with the integration weights
+            # instead of taking the inner product with a one-element
+            arr = x.asarray()
+            if (arr < 0).any():
+                # Negative entries make the value infinite in both branches
+                return np.inf
+            with np.errstate(invalid='ignore', divide='ignore'):
+                if self.prior is None:
+                    tmp = scipy.special.xlogy(arr, arr)
+                    tmp -= arr
+                    tmp += 1
+                else:
+                    prior = self._prior_arr
+                    if self.__log_prior is not None:
+                        # x log(x / g) = x log(x) - x log(g) with the
+                        # precomputed log(g)
+                        tmp = np.multiply(arr, self.__log_prior)
+                        np.subtract(scipy.special.xlogy(arr, arr), tmp,
+                                    out=tmp)
+                    else:
+                        tmp = np.divide(arr, prior)
+                        scipy.special.xlogy(arr, tmp, out=tmp)
+                    tmp -= arr
+                    tmp += prior
+                res = _weighted_sum(tmp, weights)
 
         if not np.isfinite(res):
             # In this case, some element was less than or equal to zero
@@ -1437,20 +2150,36 @@ class KullbackLeiblerCrossEntropy(Functional):
                 super(KLCrossEntropyGradient, self).__init__(
                     functional.domain, functional.domain, linear=False)
 
-            def _call(self, x):
-                """Apply the gradient operator to the given point.
+            def _call(self, x, out):
+                """Apply the gradient operator to ``x`` and store in ``out``.
 
                 The gradient is not defined in for points with components less
                 than or equal to zero.
                 """
+                if not functional._numpy_backed:
+                    # Keep backend-native element arithmetic
+                    tmp = (x.ufuncs.log() if functional.prior is None
+                           else (x / functional.prior).ufuncs.log())
+                    if not np.all(np.isfinite(tmp.asarray())):
+                        raise ValueError(
+                            'The gradient of the Kullback-Leibler '
+                            'Cross Entropy functional is not defined '
+                            'for `x` with one or more components '
+                            'less than or equal to zero.'.format(x))
+                    out.assign(tmp)
+                    return
+                out_arr = out.asarray()
                 if functional.prior is None:
-                    tmp = np.log(x)
-                else:
-                    tmp = np.log(x / functional.prior)
-
-                if np.all(np.isfinite(tmp)):
-                    return tmp
+                    np.log(x.asarray(), out=out_arr)
                 else:
+                    np.divide(x.asarray(), functional._prior_arr,
+                              out=out_arr)
+                    np.log(out_arr, out=out_arr)
+                if isinstance(out.space, ProductSpace):
+                    # `asarray` of a product space element is a copy
+                    out[:] = out_arr
+
+                if not np.all(np.isfinite(out_arr)):
                     # The derivative is not defined.
                     raise ValueError('The gradient of the Kullback-Leibler '
                                      'Cross Entropy functional is not defined '
@@ -1470,8 +2199,11 @@ class KullbackLeiblerCrossEntropy(Functional):
         odl.solvers.nonsmooth.proximal_operators.proximal_convex_conj :
             Proximal of the convex conjugate of a functional.
         """
-        return proximal_convex_conj(proximal_convex_conj_kl_cross_entropy(
-            space=self.domain, g=self.prior))
+        if self.__proximal is None:
+            self.__proximal = _memoized_scalar_proximal(
+                proximal_convex_conj(proximal_convex_conj_kl_cross_entropy(
+                    space=self.domain, g=self.prior)))
+        return self.__proximal
 
     @property
     def convex_conj(self):
@@ -1520,6 +2252,14 @@ class KullbackLeiblerCrossEntropyConvexConj(Functional):
                              ''.format(prior, self.domain))
 
         self.__prior = prior
+        self.__proximal = None
+        self._numpy_backed = _numpy_backed(space)
+        if prior is not None and self._numpy_backed:
+            # Contiguous array view of the prior, shared by the array paths
+            self._prior_arr = np.ascontiguousarray(prior.asarray())
+        else:
+            self._prior_arr = None
+        self.__weights = _integration_weights(space)
 
     @property
     def prior(self):
@@ -1529,11 +2269,25 @@ class KullbackLeiblerCrossEntropyConvexConj(Functional):
     # TODO: update when integration operator is in place: issue #440
     def _call(self, x):
         """Return the value in the point ``x``."""
-        if self.prior is None:
-            tmp = self.domain.element((np.exp(x) - 1)).inner(self.domain.one())
+        weights = self.__weights
+        if weights is None:
+            # exp stays in the space, so no array round-trip and element
+            # re-wrap is needed; the prior is folded into the inner product
+            expm1 = x.ufuncs.exp() - 1
+            if self.prior is None:
+                tmp = expm1.inner(self._domain_one)
+            else:
+                tmp = self.prior.inner(expm1)
+            return tmp
         else:
-            tmp = (self.prior * (np.exp(x) - 1)).inner(self.domain.one())
-        return tmp
+            # Reduce the integrand directly with the integration weights
+            # instead of taking the inner product with a one-element
+            # expm1 is more accurate than exp(x) - 1 near 0 and saves the
+            # subtraction pass
+            tmp = np.expm1(x.asarray())
+            if self.prior is not None:
+                tmp *= self._prior_arr
+            return _weighted_sum(tmp, weights)
 
     # TODO: replace this when UFuncOperators is in place: PL #576
     @property
@@ -1550,12 +2304,23 @@ class KullbackLeiblerCrossEntropyConvexConj(Functional):
                 super(KLCrossEntCCGradient, self).__init__(
                     functional.domain, functional.domain, linear=False)
 
-            def _call(self, x):
-                """Apply the gradient operator to the given point."""
-                if functional.prior is None:
-                    return self.domain.element(np.exp(x))
-                else:
-                    return functional.prior * np.exp(x)
+            def _call(self, x, out):
+                """Apply the gradient operator to ``x`` and store in ``out``."""
+                if not functional._numpy_backed:
+                    # Keep backend-native element arithmetic
+                    if functional.prior is None:
+                        out.assign(x.ufuncs.exp())
+                    else:
+                        out.assign(functional.prior * x.ufuncs.exp())
+                    return
+                g = functional._prior_arr
+                out_arr = out.asarray()
+                np.exp(x.asarray(), out=out_arr)
+                if g is not None:
+                    out_arr *= g
+                if isinstance(out.space, ProductSpace):
+                    # `asarray` of a product space element is a copy
+                    out[:] = out_arr
 
         return KLCrossEntCCGradient()
 
@@ -1568,8 +2333,11 @@ class KullbackLeiblerCrossEntropyConvexConj(Functional):
         odl.solvers.nonsmooth.proximal_operators.proximal_convex_conj_kl_cross_entropy :
             `proximal factory` for convex conjugate of the KL cross entropy.
         """
-        return proximal_convex_conj_kl_cross_entropy(space=self.domain,
-                                                     g=self.prior)
+        if self.__proximal is None:
+            self.__proximal = _memoized_scalar_proximal(
+                proximal_convex_conj_kl_cross_entropy(
+                    space=self.domain, g=self.prior))
+        return self.__proximal
 
     @property
     def convex_conj(self):
@@ -1680,8 +2448,20 @@ class SeparableSum(Functional):
         super(SeparableSum, self).__init__(space=domain, linear=linear)
         self.__functionals = tuple(functionals)
 
+        # A sum of one repeated functional acts on a power space and can
+        # be evaluated in a single batched call on the stacked array if
+        # the summand supports it, see `_call`
+        f0 = self.__functionals[0]
+        self.__homogeneous = all(f is f0 for f in self.__functionals[1:])
+        if self.__homogeneous:
+            self.__batch_call = getattr(f0, '_call_batch', None)
+        else:
+            self.__batch_call = None
+
     def _call(self, x):
         """Return the separable sum evaluated in ``x``."""
+        if self.__batch_call is not None:
+            return np.sum(self.__batch_call(x.asarray()))
         return sum(fi(xi) for xi, fi in zip(x, self.functionals))
 
     @property
@@ -1728,6 +2508,10 @@ class SeparableSum(Functional):
     @property
     def gradient(self):
         """Gradient operator of the functional."""
+        if self.__homogeneous:
+            # Construct the component gradient once and repeat it
+            return DiagonalOperator(self.functionals[0].gradient,
+                                    len(self.functionals))
         gradients = [func.gradient for func in self.functionals]
         return DiagonalOperator(*gradients)
 
@@ -1741,7 +2525,11 @@ class SeparableSum(Functional):
         -------
         proximal : combine_proximals
         """
-        proximals = [func.proximal for func in self.functionals]
+        if self.__homogeneous:
+            # Construct the component proximal factory once and repeat it
+            proximals = [self.functionals[0].proximal] * len(self.functionals)
+        else:
+            proximals = [func.proximal for func in self.functionals]
         return combine_proximals(*proximals)
 
     @property
@@ -1751,6 +2539,11 @@ class SeparableSum(Functional):
         Convex conjugate distributes over separable sums, so the result is
         simply the separable sum of the convex conjugates.
         """
+        if self.__homogeneous:
+            # Repeating the single conjugate keeps the sum homogeneous,
+            # so the batched evaluation path remains available
+            return SeparableSum(self.functionals[0].convex_conj,
+                                len(self.functionals))
         convex_conjs = [func.convex_conj for func in self.functionals]
         return SeparableSum(*convex_conjs)
 
@@ -1831,9 +2624,10 @@ class QuadraticForm(Functional):
         elif self.vector is None:
             return x.inner(self.operator(x)) + self.constant
         else:
-            tmp = self.operator(x)
-            tmp += self.vector
-            return x.inner(tmp) + self.constant
+            # Split by additivity of the inner product; this skips the
+            # full-size addition of `vector` to the operator output
+            return (x.inner(self.operator(x)) + x.inner(self.vector) +
+                    self.constant)
 
     @property
     def gradient(self):
@@ -1914,6 +2708,55 @@ class QuadraticForm(Functional):
                                  constant=constant)
 
 
+def _small_svdvals(arr):
+    """Singular values of a stack of matrices with ``min(n, m) <= 2``.
+
+    Equivalent to ``np.linalg.svd(arr, compute_uv=False)`` for real
+    matrices, but computed with vectorized closed-form expressions
+    instead of one LAPACK call per matrix.
+    """
+    if arr.shape[-2] > arr.shape[-1]:
+        arr = arr.swapaxes(-1, -2)
+    if arr.shape[-2] == 1:
+        return np.sqrt(np.einsum('...ij,...ij->...i', arr, arr))
+    # Eigenvalues of the symmetric 2x2 Gram matrix ``arr @ arr^T``,
+    # written in a form that keeps the discriminant nonnegative
+    g00 = np.einsum('...j,...j->...', arr[..., 0, :], arr[..., 0, :])
+    g11 = np.einsum('...j,...j->...', arr[..., 1, :], arr[..., 1, :])
+    g01 = np.einsum('...j,...j->...', arr[..., 0, :], arr[..., 1, :])
+    disc = np.sqrt((g00 - g11) ** 2 + 4.0 * g01 * g01)
+    tr = g00 + g11
+    s = np.stack([0.5 * (tr + disc), 0.5 * (tr - disc)], axis=-1)
+    np.maximum(s, 0, out=s)
+    return np.sqrt(s, out=s)
+
+
+def _small_sym_eig(mat):
+    """Eigendecomposition of a stack of symmetric 1x1 or 2x2 matrices.
+
+    Returns ``(w, q)`` with eigenvalues ``w`` in descending order and
+    orthonormal eigenvectors in the columns of ``q``, computed with
+    vectorized closed-form expressions instead of per-matrix LAPACK
+    calls.
+    """
+    if mat.shape[-1] == 1:
+        return mat[..., 0], np.ones_like(mat)
+    a = mat[..., 0, 0]
+    b = mat[..., 0, 1]
+    c = mat[..., 1, 1]
+    half_tr = 0.5 * (a + c)
+    disc = np.sqrt((0.5 * (a - c)) ** 2 + b * b)
+    w = np.stack([half_tr + disc, half_tr - disc], axis=-1)
+    # The rotation angle diagonalizing the matrix; the first column
+    # belongs to the larger eigenvalue by the arctan2 branch choice
+    theta = 0.5 * np.arctan2(2.0 * b, a - c)
+    cs = np.cos(theta)
+    sn = np.sin(theta)
+    q = np.stack([np.stack([cs, -sn], axis=-1),
+                  np.stack([sn, cs], axis=-1)], axis=-2)
+    return w, q
+
+
 class NuclearNorm(Functional):
 
     r"""Nuclear norm for matrix valued functions.
@@ -1979,6 +2822,18 @@ class NuclearNorm(Functional):
         self.pwisenorm = PointwiseNorm(self.domain[0],
                                        exponent=singular_vector_exp)
         self.pshape = (len(self.domain), len(self.domain[0]))
+        # Matrices with min(n, m) <= 2 have closed-form singular values,
+        # see `_small_svdvals`
+        self.__small_svd = (min(self.pshape) <= 2 and
+                            np.issubdtype(self.domain.dtype, np.floating))
+        # For unweighted pointwise norms with standard exponents, the
+        # norm of the singular values can be reduced over the last axis
+        # of the SVD output directly, see `_call`
+        self.__pwise_direct = (not self.pwisenorm.is_weighted and
+                               self.pwisenorm.exponent in (1, 2, np.inf))
+        # Scratch buffer backing `_asarray`, allocated on first use and
+        # reused across calls
+        self.__arr_scratch = None
 
     def _asarray(self, vec):
         """Convert ``x`` to an array.
@@ -1987,14 +2842,21 @@ class NuclearNorm(Functional):
         in order to have the access order as `numpy.linalg.svd` needs it.
 
         This is the inverse of `_asvector`.
+
+        The returned array is a view into a scratch buffer that is
+        reused across calls, so it is only valid until the next call.
         """
-        shape = self.domain[0, 0].shape + self.pshape
-        arr = np.empty(shape, dtype=self.domain.dtype)
+        if self.__arr_scratch is None:
+            self.__arr_scratch = np.empty(
+                self.pshape + self.domain[0, 0].shape,
+                dtype=self.domain.dtype)
+        # Each component is copied once into a contiguous block of the
+        # scratch buffer; the axis reorder below is a pure view
         for i, xi in enumerate(vec):
             for j, xij in enumerate(xi):
-                arr[..., i, j] = xij.asarray()
+                self.__arr_scratch[i, j] = xij.asarray()
 
-        return arr
+        return np.moveaxis(self.__arr_scratch, (0, 1), (-2, -1))
 
     def _asvector(self, arr):
         """Convert ``arr`` to a `domain` element.
@@ -2009,7 +2871,25 @@ class NuclearNorm(Functional):
 
         # Convert to array with most
         arr = self._asarray(x)
-        svd_diag = np.linalg.svd(arr, compute_uv=False)
+        if self.__small_svd:
+            svd_diag = _small_svdvals(arr)
+        else:
+            svd_diag = np.linalg.svd(arr, compute_uv=False)
+
+        if self.__pwise_direct:
+            # Reduce over the contiguous last axis directly instead of
+            # routing a moved-axis view through `pwisenorm`, which
+            # re-copies it into a product-space element. The singular
+            # values are nonnegative and sorted in descending order.
+            p = self.pwisenorm.exponent
+            if p == 1:
+                pwnorm = svd_diag.sum(axis=-1)
+            elif p == 2:
+                pwnorm = np.sqrt(
+                    np.einsum('...k,...k->...', svd_diag, svd_diag))
+            else:
+                pwnorm = svd_diag[..., 0]
+            return self.outernorm(pwnorm)
 
         # Rotate the axes so the svd-direction is first
         s_reordered = np.moveaxis(svd_diag, -1, 0)
@@ -2034,10 +2914,6 @@ class NuclearNorm(Functional):
             raise NotImplementedError('`proximal` only implemented for '
                                       '`singular_vector_exp` in [1, 2, inf]')
 
-        def nddot(a, b):
-            """Compute pointwise matrix product in the last indices."""
-            return np.einsum('...ij,...jk->...ik', a, b)
-
         func = self
 
         # Add epsilon to fix rounding errors, i.e. make sure that when we
@@ -2046,50 +2922,121 @@ class NuclearNorm(Functional):
         dtype = getattr(self.domain, 'dtype', float)
         eps = np.finfo(dtype).resolution * 10
 
+        # Matrices with min(n, m) <= 2 admit a closed-form decomposition
+        # of the Gram matrix, see `_small_sym_eig`. The branch between
+        # the right and the left Gram matrix is fixed by the shape, so
+        # it is resolved here instead of on every call.
+        small = (min(self.pshape) <= 2 and
+                 np.issubdtype(self.domain.dtype, np.floating))
+        small_right = small and self.pshape[0] >= self.pshape[1]
+        small_left = small and self.pshape[0] < self.pshape[1]
+
+        # Bound as a closure constant; cheaper to reach from the inner
+        # `_call` than the attribute chain
+        pexp = self.pwisenorm.exponent
+
         class NuclearNormProximal(Operator):
             """Proximal operator of `NuclearNorm`."""
 
             def __init__(self, sigma):
                 self.sigma = float(sigma)
+                # Contraction path of the result einsum, computed on the
+                # first call (the operand shapes are fixed by `func`)
+                self._path = None
                 super(NuclearNormProximal, self).__init__(
                     func.domain, func.domain, linear=False)
 
             def _call(self, x):
                 """Return ``self(x)``."""
+                sigma = self.sigma
                 arr = func._asarray(x)
 
-                # Compute SVD
-                U, s, Vt = np.linalg.svd(arr, full_matrices=False)
-
-                # transpose pointwise
-                V = Vt.swapaxes(-1, -2)
-
-                # Take pseudoinverse of s
-                sinv = s.copy()
-                sinv[sinv != 0] = 1 / sinv[sinv != 0]
+                # Only the singular values and one set of singular
+                # vectors enter the result below, since for any function
+                # ``f`` of the singular values
+                # ``A V f(s) V^t == U f(s) U^t A``.
+                if small_right:
+                    # Closed-form EVD of the right Gram matrix A^t A
+                    w, V = _small_sym_eig(
+                        np.einsum('...ji,...jk->...ik', arr, arr))
+                    s = np.sqrt(np.maximum(w, 0, out=w))
+                    U = None
+                elif small_left:
+                    # n < m: use the left Gram matrix A A^t instead
+                    w, U = _small_sym_eig(
+                        np.einsum('...ij,...kj->...ik', arr, arr))
+                    s = np.sqrt(np.maximum(w, 0, out=w))
+                    V = None
+                else:
+                    # Compute SVD; the left singular vectors are not
+                    # needed for the result. The batched gufunc queries
+                    # the LAPACK workspace once per call, so a manual
+                    # per-matrix loop with a cached lwork is slower.
+                    _, s, Vt = np.linalg.svd(arr, full_matrices=False)
+                    U = V = None
 
                 # Take pointwise proximal operator of s w.r.t. the norm
                 # on the singular vectors
-                if func.pwisenorm.exponent == 1:
-                    abss = np.abs(s) - (self.sigma - eps)
-                    sprox = np.sign(s) * np.maximum(abss, 0)
-                elif func.pwisenorm.exponent == 2:
+                if pexp == 1:
+                    # Soft thresholding of the singular values; fused
+                    # into one kernel or in-place sweeps since this step
+                    # is memory bound. The values are nonnegative, so
+                    # for t >= 0 only one-sided shrinkage can occur.
+                    t = sigma - eps
+                    if (numexpr is not None and t >= 0 and
+                            s.size >= _NUMEXPR_MIN_SIZE):
+                        sprox = numexpr.evaluate('where(s > t, s - t, 0)')
+                    else:
+                        sprox = np.abs(s)
+                        sprox -= t
+                        np.maximum(sprox, 0, out=sprox)
+                        sprox *= np.sign(s)
+                elif pexp == 2:
                     s_reordered = np.moveaxis(s, -1, 0)
                     snorm = func.pwisenorm(s_reordered).asarray()
-                    snorm = np.maximum(self.sigma, snorm, out=snorm)
-                    sprox = ((1 - eps) - self.sigma / snorm)[..., None] * s
-                elif func.pwisenorm.exponent == np.inf:
-                    snorm = np.sum(np.abs(s), axis=-1)
-                    snorm = np.maximum(self.sigma, snorm, out=snorm)
-                    sprox = ((1 - eps) - self.sigma / snorm)[..., None] * s
+                    np.maximum(sigma, snorm, out=snorm)
+                    # Rewrite snorm in place to the shrinkage factor
+                    # (1 - eps) - sigma / snorm, avoiding temporaries
+                    np.divide(sigma, snorm, out=snorm)
+                    np.subtract(1 - eps, snorm, out=snorm)
+                    sprox = snorm[..., None] * s
+                elif pexp == np.inf:
+                    snorm = np.abs(s).sum(axis=-1)
+                    np.maximum(sigma, snorm, out=snorm)
+                    np.divide(sigma, snorm, out=snorm)
+                    np.subtract(1 - eps, snorm, out=snorm)
+                    sprox = snorm[..., None] * s
                 else:
                     raise RuntimeError
 
-                # Compute s matrix
-                sproxsinv = (sprox * sinv)[..., :, None]
-
-                # Compute the final result
-                result = nddot(nddot(arr, V), sproxsinv * Vt)
+                # Diagonal entries of the spectral scaling matrix,
+                # sprox / s with the pseudoinverse convention at 0,
+                # as one masked divide instead of a separate
+                # fancy-indexed reciprocal
+                d = np.divide(sprox, s, out=np.zeros_like(s),
+                              where=(s != 0))
+
+                # Contract everything in one einsum call with a cached
+                # path, avoiding the full-size intermediate of a
+                # two-step matrix product. The scaling enters as a
+                # vector operand instead of a broadcast multiply.
+                if V is not None:
+                    subscripts = '...ij,...jk,...k,...lk->...il'
+                    operands = (arr, V, d, V)
+                elif U is not None:
+                    subscripts = '...ij,...j,...kj,...kl->...il'
+                    operands = (U, d, U, arr)
+                else:
+                    # Both vector factors come from Vt; contracting over
+                    # its contiguous last axis instead of a transposed
+                    # view avoids a copy inside the matmul kernels
+                    subscripts = '...ij,...kj,...k,...kl->...il'
+                    operands = (arr, Vt, d, Vt)
+                if self._path is None:
+                    self._path = np.einsum_path(subscripts, *operands,
+                                                optimize='optimal')[0]
+                result = np.einsum(subscripts, *operands,
+                                   optimize=self._path)
 
                 # Cast to vector and return. Note array and vector have
                 # different shapes.
@@ -2269,6 +3216,7 @@ class IndicatorSimplex(Functional):
         super(IndicatorSimplex, self).__init__(
             space=space, linear=False, grad_lipschitz=np.nan)
         self.diameter = float(diameter)
+        self._numpy_backed = _numpy_backed(space)
 
         if sum_rtol is None:
             if space.dtype == 'float64':
@@ -2279,12 +3227,20 @@ class IndicatorSimplex(Functional):
 
     def _call(self, x):
         """Return ``self(x)``."""
+        if self._numpy_backed:
+            # Scalar reductions on the raw array instead of a
+            # materialized boolean mask; the tiled sign scan returns
+            # early on infeasible points before the sum is taken
+            arr = x.asarray()
+            if _any_negative(arr):
+                return np.inf
+            total = arr.sum()
+        else:
+            if x.ufuncs.min() < 0:
+                return np.inf
+            total = x.ufuncs.sum()
 
-        sum_constr = abs(x.ufuncs.sum() / self.diameter - 1) <= self.sum_rtol
-
-        nonneq_constr = x.ufuncs.greater_equal(0).asarray().all()
-
-        if sum_constr and nonneq_constr:
+        if abs(total / self.diameter - 1) <= self.sum_rtol:
             return 0
         else:
             return np.inf
@@ -2394,11 +3350,16 @@ class IndicatorSumConstraint(Functional):
                 sum_rtol = 1e-6 * self.domain.size
         self.sum_rtol = float(sum_rtol)
         self.sum_value = float(sum_value)
+        self._numpy_backed = _numpy_backed(space)
 
     def _call(self, x):
         """Return ``self(x)``."""
+        if self._numpy_backed:
+            total = x.asarray().sum()
+        else:
+            total = x.ufuncs.sum()
 
-        if abs(x.ufuncs.sum() / self.sum_value - 1) <= self.sum_rtol:
+        if abs(total / self.sum_value - 1) <= self.sum_rtol:
             return 0
         else:
             return np.inf
@@ -2417,6 +3378,9 @@ class IndicatorSumConstraint(Functional):
         """Return the `proximal factory` of the functional."""
 
         domain = self.domain
+        sum_value = self.sum_value
+        inv_size = 1.0 / domain.size
+        numpy_backed = self._numpy_backed
 
         class ProximalSum(Operator):
             """Proximal operator."""
@@ -2427,10 +3391,19 @@ class IndicatorSumConstraint(Functional):
                     domain=domain, range=domain, linear=False)
 
             def _call(self, x, out):
-
-                offset = 1 / x.size * (self.sum_value - x.ufuncs.sum())
-                out.assign(x)
-                out += offset
+                if numpy_backed:
+                    # Single fused pass instead of copying x into out
+                    # and adding the offset in a second sweep
+                    arr = x.asarray()
+                    offset = inv_size * (sum_value - arr.sum())
+                    out_arr = out.asarray()
+                    np.add(arr, offset, out=out_arr)
+                    if isinstance(out.space, ProductSpace):
+                        out[:] = out_arr
+                else:
+                    offset = inv_size * (sum_value - x.ufuncs.sum())
+                    out.assign(x)
+                    out += offset
 
         return ProximalSum
 
@@ -2625,6 +3598,16 @@ class Huber(Functional):
 
         super(Huber, self).__init__(
             space=space, linear=False, grad_lipschitz=grad_lipschitz)
+        self._numpy_backed = _numpy_backed(space)
+        if isinstance(space, ProductSpace):
+            self._pwise_norm = PointwiseNorm(space, 2)
+            norm_space = space[0]
+        else:
+            self._pwise_norm = None
+            norm_space = space
+        # Weights of the integration over the pointwise norm, or None
+        # if the weighting has no such representation
+        self.__norm_weights = _integration_weights(norm_space)
 
     @property
     def gamma(self):
@@ -2633,20 +3616,36 @@ class Huber(Functional):
 
     def _call(self, x):
         """Return ``self(x)``."""
-        if isinstance(self.domain, ProductSpace):
-            norm = PointwiseNorm(self.domain, 2)(x)
+        if self._pwise_norm is not None:
+            norm = self._pwise_norm(x)
         else:
             norm = x.ufuncs.absolute()
 
+        weights = self.__norm_weights
         if self.gamma > 0:
-            tmp = norm.ufuncs.square()
-            tmp *= 1 / (2 * self.gamma)
+            if self._numpy_backed:
+                # Branchless single-pass evaluation instead of boolean
+                # fancy indexing over the two cases
+                narr = norm.asarray()
+                tmp_arr = np.where(narr >= self.gamma,
+                                   narr - self.gamma / 2,
+                                   narr * narr * (1 / (2 * self.gamma)))
+                if weights is not None:
+                    return _weighted_sum(tmp_arr, weights)
+                tmp = norm.space.element(tmp_arr)
+            else:
+                tmp = norm.ufuncs.square()
+                tmp *= 1 / (2 * self.gamma)
 
-            index = norm.ufuncs.greater_equal(self.gamma)
-            tmp[index] = norm[index] - self.gamma / 2
+                index = norm.ufuncs.greater_equal(self.gamma)
+                tmp[index] = norm[index] - self.gamma / 2
         else:
+            if self._numpy_backed and weights is not None:
+                return _weighted_sum(norm.asarray(), weights)
             tmp = norm
 
+        # Reduce with the integration weights directly when possible;
+        # the inner product with a one-element is the generic fallback
         return tmp.inner(tmp.space.one())
 
     @property
@@ -2723,11 +3722,17 @@ class Huber(Functional):
 
             def _call(self, x):
                 """Apply the gradient operator to the given point."""
-                if isinstance(self.domain, ProductSpace):
-                    norm = PointwiseNorm(self.domain, 2)(x)
+                if functional._pwise_norm is not None:
+                    norm = functional._pwise_norm(x)
                 else:
                     norm = x.ufuncs.absolute()
 
+                if functional._numpy_backed:
+                    # The gradient is x / max(||x||, gamma), evaluated
+                    # as one division broadcast over all components
+                    denom = np.maximum(norm.asarray(), functional.gamma)
+                    return self.range.element(x.asarray() / denom)
+
                 grad = x / functional.gamma
 
                 index = norm.ufuncs.greater_equal(functional.gamma)
@@ -67,6 +67,21 @@ class Functional(Operator):
         Operator.__init__(self, domain=space, range=space.field, linear=linear)
         self.__grad_lipschitz = float(grad_lipschitz)
 
+    # Default for the lazily cached one-element, see `_domain_one`
+    __one = None
+
+    @property
+    def _domain_one(self):
+        """Cached one-element of the domain.
+
+        The one-element is a constant of the functional; caching it avoids
+        a full-size allocation per evaluation in implementations of
+        ``_call`` that integrate via an inner product with one.
+        """
+        if self.__one is None:
+            self.__one = self.domain.one()
+        return self.__one
+
     @property
     def grad_lipschitz(self):
         """Lipschitz constant for the gradient of the functional."""